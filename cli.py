@@ -1,19 +1,60 @@
-import toml
 import sys
+from sys import intern
 import os
-import gzip
-import re
-from urllib import request as url_request
-from urllib.error import URLError, HTTPError
-from collections import defaultdict, deque
+import io
+import hashlib
+import pickle
+from pathlib import Path
+from array import array
+from collections import OrderedDict, defaultdict, deque, namedtuple
+from itertools import islice
 import argparse
 
+# Размер буфера чтения для распаковки Packages.gz (меньше мелких read() вызовов)
+GZIP_BUFFER_SIZE = 256 * 1024
+
+# Буфер для HTTP-ответа: сеть заполняет его крупными порциями впереди распаковки
+NETWORK_BUFFER_SIZE = 1 << 20
+
+# Заголовки запроса к репозиторию: Packages.gz уже сжат, повторное сжатие не нужно
+HTTP_HEADERS = {'User-Agent': 'rezzur/1.0', 'Accept-Encoding': 'identity'}
+
+# Число блоков пакетов, передаваемых одному процессу за раз при --jobs > 1
+PARSE_CHUNK_SIZE = 2000
+
+# Каталог для кэша разобранных графов зависимостей
+CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'rezzur'
+
+# Версия формата кэша — увеличивать при любом изменении результата разбора или CompiledGraph
+GRAPH_CACHE_VERSION = 2
+
+# Сколько результатов get_transitive_dependencies помнить для одного графа
+TRANSITIVE_CACHE_SIZE = 1024
+
+
+# Граф в формате CSR: зависимости вершины i — indices[indptr[i]:indptr[i + 1]];
+# первые package_count вершин — пакеты из репозитория, остальные встречаются только в Depends
+class CompiledGraph(namedtuple('CompiledGraph', ['names', 'name_to_id', 'indptr', 'indices', 'package_count'])):
+    """CSR-граф зависимостей; memo — LRU-кэш обходов, атрибут вне полей записи (на диск не попадает)"""
+
+    def __new__(cls, *args, **kwargs):
+        graph = super().__new__(cls, *args, **kwargs)
+        graph.memo = OrderedDict()
+        return graph
+
 
 def load_config(config_path):
     """Загрузка конфигурации из TOML файла"""
+    # Импорты модулей отложены до места использования, чтобы ускорить запуск CLI
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            return toml.load(f)
+        import tomllib
+    except ImportError:
+        # Python < 3.11
+        import tomli as tomllib
+
+    try:
+        with open(config_path, 'rb') as f:
+            return tomllib.load(f)
     except FileNotFoundError:
         print(f"Ошибка: Файл конфигурации не найден: {config_path}")
         sys.exit(1)
@@ -63,91 +104,226 @@ def validate_config(config):
     return errors
 
 
-def get_packages_data(config):
-    """Загружает и распаковывает файл Packages.gz"""
+def split_package_blocks(stream):
+    """Режет бинарный поток на блоки пакетов, разделенные пустой строкой"""
+    tail = b""
+    while True:
+        chunk = stream.read(GZIP_BUFFER_SIZE)
+        if not chunk:
+            break
+        blocks = (tail + chunk).split(b'\n\n')
+        # Последний кусок может быть незавершенным блоком — переносим его дальше
+        tail = blocks.pop()
+        for block in blocks:
+            if block.strip():
+                yield block
+    if tail.strip():
+        yield tail
+
+
+def open_packages_source(config):
+    """Открывает исходный файл Packages(.gz): HTTP-ответ или локальный файл"""
+    repo_url = config['repository_url']
+
+    if config['working_mode'] == 'remote':
+        full_url = (
+            f"{repo_url}/dists/{config['distribution']}/"
+            f"{config['component']}/binary-{config['architecture']}/Packages.gz"
+        )
+        print(f"Загрузка из: {full_url}")
+        from urllib import request as url_request
+        return url_request.urlopen(url_request.Request(full_url, headers=HTTP_HEADERS))
+
+    print(f"Чтение из локального файла: {repo_url}")
+    # Без собственного буфера: поток читается через BufferedReader размера GZIP_BUFFER_SIZE
+    return open(repo_url, 'rb', buffering=0)
+
+
+def exit_on_fetch_error(error, repo_url):
+    """Печатает ошибку получения данных о пакетах и завершает работу"""
+    from urllib.error import URLError, HTTPError
+
+    if isinstance(error, HTTPError):
+        print(f"Ошибка HTTP при загрузке данных: {error.code} {error.reason}")
+    elif isinstance(error, URLError):
+        print(f"Ошибка URL: Не удалось подключиться. {error.reason}")
+    elif isinstance(error, FileNotFoundError):
+        print(f"Ошибка: Локальный файл не найден: {repo_url}")
+    else:
+        print(f"Неизвестная ошибка при получении данных: {error}")
+    sys.exit(1)
+
+
+def read_packages_source(config):
+    """Читает исходный файл Packages(.gz) целиком, без распаковки"""
+    print(f"Режим работы: {config['working_mode']}. Получение данных...")
+
+    try:
+        with open_packages_source(config) as source:
+            return source.read()
+    except Exception as e:
+        exit_on_fetch_error(e, config['repository_url'])
+
+
+def is_compressed_source(config):
+    """Определяет, нужно ли распаковывать исходный файл Packages как gzip"""
+    return config['working_mode'] == 'remote' or config['repository_url'].endswith('.gz')
+
+
+def iter_packages_blocks(config, data=None):
+    """Потоково выдает блоки пакетов (bytes) из файла Packages(.gz) или из уже прочитанного data"""
     mode = config['working_mode']
     repo_url = config['repository_url']
+    compressed = is_compressed_source(config)
 
-    print(f"Режим работы: {mode}. Получение данных...")
+    if data is None:
+        print(f"Режим работы: {mode}. Получение данных...")
 
     try:
-        if mode == 'remote':
-            full_url = (
-                f"{repo_url}/dists/{config['distribution']}/"
-                f"{config['component']}/binary-{config['architecture']}/Packages.gz"
-            )
-            print(f"Загрузка из: {full_url}")
-
-            with url_request.urlopen(full_url) as response:
-                with gzip.GzipFile(fileobj=response) as gzip_file:
-                    return gzip_file.read().decode('utf-8')
-
-        elif mode == 'local' or mode == 'test':
-            print(f"Чтение из локального файла: {repo_url}")
-            if repo_url.endswith('.gz'):
-                with gzip.open(repo_url, 'rt', encoding='utf-8') as f:
-                    return f.read()
+        with (io.BytesIO(data) if data is not None else open_packages_source(config)) as source:
+            streaming = data is None and mode == 'remote'
+            buffer_size = NETWORK_BUFFER_SIZE if streaming else GZIP_BUFFER_SIZE
+            buffered = io.BufferedReader(source, buffer_size=buffer_size)
+            if compressed:
+                try:
+                    # ISA-L распаковывает gzip в ~2 раза быстрее zlib, API совместим с gzip
+                    from isal import igzip as gzip_mod
+                except ImportError:
+                    import gzip as gzip_mod
+                with gzip_mod.GzipFile(fileobj=buffered) as gzip_file:
+                    yield from split_package_blocks(gzip_file)
             else:
-                with open(repo_url, 'r', encoding='utf-8') as f:
-                    return f.read()
-
-    except HTTPError as e:
-        print(f"Ошибка HTTP при загрузке данных: {e.code} {e.reason}")
-        sys.exit(1)
-    except URLError as e:
-        print(f"Ошибка URL: Не удалось подключиться. {e.reason}")
-        sys.exit(1)
-    except FileNotFoundError:
-        print(f"Ошибка: Локальный файл не найден: {repo_url}")
-        sys.exit(1)
+                yield from split_package_blocks(buffered)
     except Exception as e:
-        print(f"Неизвестная ошибка при получении данных: {e}")
-        sys.exit(1)
+        exit_on_fetch_error(e, repo_url)
 
 
 def parse_package_dependencies(block):
     """Парсит зависимости из блока пакета"""
     package_info = {}
-    lines = block.split('\n')
 
-    for line in lines:
+    # Нужны только поля Package и Depends — остальные строки блока пропускаем
+    for line in block.splitlines():
         if line.startswith('Package: '):
-            package_info['Package'] = line.split(': ', 1)[1].strip()
+            package_info['Package'] = intern(line[9:].strip())
         elif line.startswith('Depends: '):
-            deps_string = line.split(': ', 1)[1].strip()
+            deps_string = line[9:]
             # Упрощенный парсинг зависимостей (игнорируем версии)
             dependencies = []
             for dep in deps_string.split(','):
-                dep = dep.strip()
-                # Убираем информацию о версии (все что в скобках)
-                dep = re.sub(r'\([^)]*\)', '', dep).strip()
                 # Убираем альтернативы (все что после |)
-                dep = dep.split('|')[0].strip()
+                dep = dep.partition('|')[0]
+                # Убираем информацию о версии (все что в скобках)
+                idx = dep.find('(')
+                if idx != -1:
+                    dep = dep[:idx]
+                dep = dep.strip()
                 if dep:
-                    dependencies.append(dep)
+                    # Одно и то же имя встречается в тысячах Depends — храним один объект
+                    dependencies.append(intern(dep))
             package_info['Depends'] = dependencies
 
+        if len(package_info) == 2:
+            break
+
     return package_info
 
 
-def build_dependency_graph(packages_data):
-    """Строит граф зависимостей из всех пакетов"""
-    graph = defaultdict(list)
-    package_blocks = packages_data.split('\n\n')
+def parse_package_chunk(blocks):
+    """Разбирает пачку блоков пакетов в список пар (имя, зависимости)"""
+    parsed = []
+    for block in blocks:
+        # Имена пакетов и Depends — ASCII, latin-1 декодирует байты один к одному
+        package_info = parse_package_dependencies(block.decode('latin-1'))
+        if 'Package' in package_info:
+            parsed.append((package_info['Package'], package_info.get('Depends', [])))
+    return parsed
 
-    for block in package_blocks:
-        if not block.strip():
-            continue
 
-        package_info = parse_package_dependencies(block)
-        if 'Package' in package_info:
-            package_name = package_info['Package']
-            dependencies = package_info.get('Depends', [])
+def iter_chunks(items, size):
+    """Группирует поток элементов в списки длиной не более size"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def build_dependency_graph(package_blocks, jobs=1):
+    """Строит граф зависимостей из потока блоков пакетов (при jobs > 1 — в нескольких процессах)"""
+    graph = defaultdict(list)
+
+    if jobs <= 1:
+        for package_name, dependencies in parse_package_chunk(package_blocks):
             graph[package_name] = dependencies
+        return graph
+
+    # Импорт отложен: multiprocessing заметно замедляет запуск, а нужен только при --jobs > 1
+    from concurrent.futures import ProcessPoolExecutor
+
+    def merge(parsed):
+        for package_name, dependencies in parsed:
+            # Строки пришли из другого процесса — интернируем их заново
+            graph[intern(package_name)] = [intern(dep) for dep in dependencies]
+
+    with ProcessPoolExecutor(max_workers=jobs) as executor:
+        # Не более 2 * jobs пачек в работе, чтобы не держать все блоки в памяти;
+        # результаты забираются в порядке отправки
+        pending = deque()
+        for chunk in iter_chunks(package_blocks, PARSE_CHUNK_SIZE):
+            pending.append(executor.submit(parse_package_chunk, chunk))
+            if len(pending) >= 2 * jobs:
+                merge(pending.popleft().result())
+        while pending:
+            merge(pending.popleft().result())
+
+    return graph
+
+
+def load_dependency_graph(config, jobs=1):
+    """Возвращает CSR-граф зависимостей, используя кэш на диске по SHA-256 исходного файла"""
+    data = read_packages_source(config)
+    digest = hashlib.sha256(data).hexdigest()
+    # Одни и те же байты разбираются по-разному в зависимости от распаковки — она входит в ключ
+    kind = 'gz' if is_compressed_source(config) else 'raw'
+    cache_path = CACHE_DIR / f"packages.v{GRAPH_CACHE_VERSION}.{kind}.{digest}.pkl"
+
+    try:
+        with open(cache_path, 'rb') as f:
+            graph = CompiledGraph(**pickle.load(f))
+        print(f"Граф загружен из кэша: {cache_path}")
+        return graph
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        print(f"Предупреждение: кэш поврежден и будет перестроен ({e})")
+
+    graph = compile_graph(build_dependency_graph(iter_packages_blocks(config, data), jobs))
+    if graph.package_count:
+        save_graph_cache(graph, cache_path)
 
     return graph
 
 
+def save_graph_cache(graph, cache_path):
+    """Атомарно сохраняет CSR-граф в кэш: пишет во временный файл и переименовывает его"""
+    import tempfile
+
+    tmp_path = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile('wb', dir=CACHE_DIR, suffix='.tmp', delete=False) as f:
+            tmp_path = f.name
+            # Сохраняем поля по именам обычным словарем — без привязки к модулю __main__
+            pickle.dump(graph._asdict(), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"Предупреждение: не удалось сохранить кэш графа: {e}")
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
 def parse_test_graph(file_path):
     """Парсит тестовый граф из файла"""
     graph = defaultdict(list)
@@ -170,83 +346,203 @@ def parse_test_graph(file_path):
     return graph
 
 
-def bfs_dependencies_recursive(graph, start_package, max_depth, current_depth, visited, filter_substring, result):
-    """Рекурсивный BFS для поиска зависимостей с учетом глубины и фильтра"""
-    if current_depth > max_depth:
-        return
+def compile_graph(graph):
+    """Упаковывает граф в формат CSR: номера вершин и плоские массивы смежности"""
+    names = list(graph)
+    package_count = len(names)
+    name_to_id = {name: i for i, name in enumerate(names)}
+    # Зависимости, которых нет среди пакетов (виртуальные и т.п.), тоже получают номер
+    for deps in graph.values():
+        for dep in deps:
+            if dep not in name_to_id:
+                name_to_id[dep] = len(names)
+                names.append(dep)
 
-    if start_package in visited:
-        return
+    indptr = array('i', [0])
+    indices = array('i')
+    for name in names:
+        indices.extend([name_to_id[dep] for dep in graph.get(name, ())])
+        indptr.append(len(indices))
 
-    visited.add(start_package)
+    return CompiledGraph(names, name_to_id, indptr, indices, package_count)
 
-    # Применяем фильтр
-    if filter_substring and filter_substring in start_package:
-        return
 
-    if start_package not in graph:
-        return
+def has_package(graph, package):
+    """Проверяет, что пакет описан в репозитории, а не только упомянут в Depends"""
+    node = graph.name_to_id.get(package)
+    return node is not None and node < graph.package_count
 
-    for dependency in graph[start_package]:
-        if dependency not in visited and (not filter_substring or filter_substring not in dependency):
-            result[dependency] = current_depth
-            bfs_dependencies_recursive(graph, dependency, max_depth, current_depth + 1, visited, filter_substring,
-                                       result)
+
+def get_direct_dependencies(graph, package):
+    """Возвращает прямые зависимости пакета из CSR-графа"""
+    node = graph.name_to_id.get(package)
+    if node is None:
+        return []
+    names = graph.names
+    return [names[dep] for dep in graph.indices[graph.indptr[node]:graph.indptr[node + 1]]]
 
 
 def get_transitive_dependencies(graph, start_package, max_depth=3, filter_substring=""):
-    """Получает транзитивные зависимости с использованием BFS"""
-    if start_package not in graph:
+    """Получает транзитивные зависимости с использованием итеративного BFS по CSR-графу"""
+    start = graph.name_to_id.get(start_package)
+    if start is None:
         return {}
 
-    result = {}
-    visited = set()
+    key = (start_package, max_depth, filter_substring)
+    memo = graph.memo
+    if key in memo:
+        memo.move_to_end(key)
+        return dict(memo[key])
 
-    bfs_dependencies_recursive(graph, start_package, max_depth, 1, visited, filter_substring, result)
-
-    return result
-
-
-def detect_cycles(graph):
-    """Обнаруживает циклические зависимости в графе"""
+    names, indptr, indices = graph.names, graph.indptr, graph.indices
+    result = {}
+    visited = bytearray(len(names))
+    visited[start] = 1
+    queue = deque([(start, 0)])
 
-    def dfs(node, path, visited, rec_stack, cycles):
-        visited.add(node)
-        rec_stack.add(node)
-        path.append(node)
+    while queue:
+        node, depth = queue.popleft()
+        if depth == max_depth:
+            continue
 
-        for neighbor in graph.get(node, []):
-            if neighbor not in graph:
+        for j in range(indptr[node], indptr[node + 1]):
+            dependency = indices[j]
+            if visited[dependency]:
                 continue
-            if neighbor not in visited:
-                dfs(neighbor, path, visited, rec_stack, cycles)
-            elif neighbor in rec_stack:
-                # Найден цикл
-                cycle_start = path.index(neighbor)
-                cycle = path[cycle_start:]
-                cycles.add(tuple(cycle))
-
-        path.pop()
-        rec_stack.remove(node)
+            name = names[dependency]
+            if filter_substring and filter_substring in name:
+                continue
+            visited[dependency] = 1
+            # BFS гарантирует минимальную глубину для каждого пакета
+            result[name] = depth + 1
+            queue.append((dependency, depth + 1))
+
+    memo[key] = result
+    if len(memo) > TRANSITIVE_CACHE_SIZE:
+        memo.popitem(last=False)
+    # Копия, чтобы изменения у вызывающего не портили кэш
+    return dict(result)
+
+
+def tarjan_scc(graph, roots=None):
+    """Итеративный алгоритм Тарьяна: компоненты сильной связности CSR-графа, достижимые из roots"""
+    indptr, indices = graph.indptr, graph.indices
+    n = len(graph.names)
+    index = [-1] * n
+    lowlink = [0] * n
+    on_stack = bytearray(n)
+    scc_stack = []
+    components = []
+    counter = 0
+
+    # Компонента сильной связности либо целиком достижима из roots, либо не достижима вовсе
+    for root in (range(n) if roots is None else roots):
+        if index[root] != -1:
+            continue
 
-    visited = set()
-    cycles = set()
+        index[root] = lowlink[root] = counter
+        counter += 1
+        scc_stack.append(root)
+        on_stack[root] = 1
+        # Кадр стека: вершина и позиция следующего ребра в indices
+        work = [[root, indptr[root]]]
+
+        while work:
+            frame = work[-1]
+            node, j = frame
+            end = indptr[node + 1]
+            descended = False
+            while j < end:
+                neighbor = indices[j]
+                j += 1
+                if index[neighbor] == -1:
+                    frame[1] = j
+                    index[neighbor] = lowlink[neighbor] = counter
+                    counter += 1
+                    scc_stack.append(neighbor)
+                    on_stack[neighbor] = 1
+                    work.append([neighbor, indptr[neighbor]])
+                    descended = True
+                    break
+                if on_stack[neighbor] and index[neighbor] < lowlink[node]:
+                    lowlink[node] = index[neighbor]
+            if descended:
+                continue
 
-    for node in graph:
-        if node not in visited:
-            dfs(node, [], visited, set(), cycles)
+            # Все соседи обработаны — возвращаемся к родителю
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if lowlink[node] < lowlink[parent]:
+                    lowlink[parent] = lowlink[node]
+
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = scc_stack.pop()
+                    on_stack[member] = 0
+                    component.append(member)
+                    if member == node:
+                        break
+                component.reverse()
+                components.append(component)
+
+    return components
+
+
+def find_cycle_in_component(graph, component):
+    """Восстанавливает реальный цикл внутри компоненты: кратчайший путь от первой вершины обратно к ней"""
+    indptr, indices = graph.indptr, graph.indices
+    members = set(component)
+    start = component[0]
+    parent = {start: None}
+    queue = deque([start])
+
+    while queue:
+        node = queue.popleft()
+        for j in range(indptr[node], indptr[node + 1]):
+            neighbor = indices[j]
+            if neighbor == start:
+                cycle = []
+                while node is not None:
+                    cycle.append(node)
+                    node = parent[node]
+                cycle.reverse()
+                return cycle
+            if neighbor in members and neighbor not in parent:
+                parent[neighbor] = node
+                queue.append(neighbor)
+
+    return []
+
+
+def detect_cycles(graph, start_package=None):
+    """Обнаруживает циклические зависимости, достижимые из start_package (по умолчанию — во всем графе)"""
+    names = graph.names
+    roots = None if start_package is None else [graph.name_to_id[start_package]]
+    cycles = []
+    for component in tarjan_scc(graph, roots):
+        # Порядок обнаружения в алгоритме Тарьяна — не путь, поэтому цикл восстанавливаем по ребрам.
+        # Пустой результат — одиночный пакет без зависимости от самого себя
+        cycle = find_cycle_in_component(graph, component)
+        if cycle:
+            cycles.append([names[member] for member in cycle])
 
     return cycles
 
 
-def print_dependency_tree(dependencies, graph, start_package, indent=0):
-    """Рекурсивно печатает дерево зависимостей"""
-    for dep, depth in sorted(dependencies.items()):
-        if depth == 1:
-            print("  " * indent + f"├── {dep}")
-            # Рекурсивно печатаем зависимости этой зависимости
-            sub_deps = {k: v - 1 for k, v in dependencies.items() if v > 1}
-            print_dependency_tree(sub_deps, graph, dep, indent + 1)
+def print_dependency_tree(graph, start, dependencies, indent=0, printed=None):
+    """Рекурсивно печатает дерево зависимостей с глубинами из результата BFS"""
+    if printed is None:
+        printed = {start}
+
+    for dep in get_direct_dependencies(graph, start):
+        # Пакет печатается один раз — под родителем, через которого BFS нашел кратчайший путь
+        if dep in printed or dependencies.get(dep) != indent + 1:
+            continue
+        printed.add(dep)
+        print("  " * indent + f"├── {dep}")
+        print_dependency_tree(graph, dep, dependencies, indent + 1, printed)
 
 
 def main():
@@ -256,6 +552,9 @@ def main():
     parser.add_argument('--depth', type=int, help='Максимальная глубина анализа (переопределяет config)')
     parser.add_argument('--filter', help='Подстрока для фильтрации пакетов (переопределяет config)')
     parser.add_argument('--test-file', help='Путь к тестовому файлу графа')
+    parser.add_argument('--no-cache', action='store_true', help='Не использовать кэш разобранного графа')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Число процессов для разбора Packages (0 — по числу ядер)')
 
     args = parser.parse_args()
 
@@ -272,6 +571,8 @@ def main():
 
     # Валидация
     errors = validate_config(config)
+    if args.jobs < 0:
+        errors.append("Число процессов (--jobs) не может быть отрицательным")
     if errors:
         print("Ошибки конфигурации:")
         for error in errors:
@@ -286,16 +587,18 @@ def main():
             sys.exit(1)
 
         print(f"Тестовый режим: загрузка графа из {test_file}")
-        graph = parse_test_graph(test_file)
+        graph = compile_graph(parse_test_graph(test_file))
     else:
         # Режим работы с реальными пакетами
-        packages_data_str = get_packages_data(config)
-        if not packages_data_str:
+        jobs = args.jobs or os.cpu_count() or 1
+        if args.no_cache:
+            graph = compile_graph(build_dependency_graph(iter_packages_blocks(config), jobs))
+        else:
+            graph = load_dependency_graph(config, jobs)
+        if not graph.package_count:
             print("Не удалось получить данные о пакетах.")
             sys.exit(1)
 
-        graph = build_dependency_graph(packages_data_str)
-
     target_package = config['package_name']
     max_depth = config.get('max_depth', 3)
     filter_substring = config.get('filter_substring', '')
@@ -306,21 +609,21 @@ def main():
         print(f"Фильтр: исключаем пакеты содержащие '{filter_substring}'")
 
     # Проверка существования пакета
-    if target_package not in graph:
+    if not has_package(graph, target_package):
         print(f"Ошибка: Пакет '{target_package}' не найден в графе")
         sys.exit(1)
 
-    # Обнаружение циклических зависимостей
-    cycles = detect_cycles(graph)
+    # Обнаружение циклических зависимостей (только в подграфе, достижимом из пакета)
+    cycles = detect_cycles(graph, target_package)
     if cycles:
         print("\n⚠️  Обнаружены циклические зависимости:")
         for cycle in cycles:
-            print(f"  Цикл: {' -> '.join(cycle)} -> ...")
+            print(f"  Цикл: {' -> '.join(cycle)} -> {cycle[0]}")
     else:
         print("\n✓ Циклические зависимости не обнаружены")
 
     # Получение транзитивных зависимостей
-    print(f"\nТранзитивные зависимости (BFS с рекурсией):")
+    print(f"\nТранзитивные зависимости (BFS):")
     dependencies = get_transitive_dependencies(graph, target_package, max_depth, filter_substring)
 
     if not dependencies:
@@ -333,7 +636,7 @@ def main():
         # Дополнительная информация
         print(f"\nДополнительная статистика:")
         print(
-            f"  Прямые зависимости: {len([d for d in graph[target_package] if not filter_substring or filter_substring not in d])}")
+            f"  Прямые зависимости: {len([d for d in get_direct_dependencies(graph, target_package) if not filter_substring or filter_substring not in d])}")
         print(f"  Всего транзитивных зависимостей: {len(dependencies)}")
 
         # Поиск самого длинного пути
@@ -343,6 +646,10 @@ def main():
             print(f"  Максимальная глубина зависимостей: {max_depth_found}")
             print(f"  Самые глубокие зависимости: {', '.join(deepest_packages)}")
 
+        print(f"\nДерево зависимостей:")
+        print(target_package)
+        print_dependency_tree(graph, target_package, dependencies)
+
 
 if __name__ == "__main__":
     main()
\ No newline at end of file